@@ -1,11 +1,32 @@
 from telegram import Update
 from telegram.ext import Application, MessageHandler, filters, CallbackContext, CommandHandler
+import asyncio
+import atexit
+import heapq
 import json
 import logging
+import os
+import queue
+import re
+import struct
+import sys
+import time
+from array import array
 from enum import Enum
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
+from bisect import bisect_right
 from collections import defaultdict
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from operator import itemgetter
+
+import orjson
+
+try:
+    import ahocorasick
+except ImportError:  # 未安装 pyahocorasick 时退回到正则匹配
+    ahocorasick = None
 
 class PermissionLevel(Enum):
     PUBLIC = "PUBLIC"  # ✅ Add this line
@@ -13,72 +34,312 @@ class PermissionLevel(Enum):
     ADMIN = "ADMIN"
     OWNER = "OWNER"
 
+# 角色等级，数值越大权限越高
+_ROLE_HIERARCHY = {"PUBLIC": 0, "MEMBER": 1, "ADMIN": 2, "OWNER": 3}
+
+# 统计周期；未知的周期按全部保留的历史（见 MessageStats.RETENTION）计算
+_PERIODS = {
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+}
+_ALL_TIME = timedelta(days=99999)
+
+# 发言时间的磁盘格式：uint32 小端秒级时间戳
+_TS_STRUCT = struct.Struct("<I")
+
+# Windows 上 os.open 默认是文本模式
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+def _open_dir(path: str) -> Optional[int]:
+    """打开目录供 dir_fd 参数使用；平台不支持 dir_fd 时返回 None"""
+    if os.open not in os.supports_dir_fd:
+        return None
+    return os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+
+def _write_all(fd: int, data: bytes):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def _atomic_write(path: str, data: bytes, dir_fd: Optional[int] = None):
+    """先写同目录下的临时文件并 fsync，再用 os.replace 替换，写到一半崩溃也不会损坏原文件
+
+    给定 dir_fd 时 path 是相对该目录的文件名，打开文件时不必再逐级解析路径。
+    """
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644, dir_fd=dir_fd)
+    try:
+        _write_all(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+
+def _pack_ts(timestamps: array) -> bytes:
+    """把发言时间数组编码成磁盘格式（小端 uint32）"""
+    if sys.byteorder != "little":
+        timestamps = array("I", timestamps)
+        timestamps.byteswap()
+    return timestamps.tobytes()
+
 class MessageStats:
+    # 每累计多少条消息或多少秒，清理一次过期的发言时间
+    MAINTAIN_EVERY_MESSAGES = 500
+    MAINTAIN_INTERVAL_SECONDS = 30
+    # 只保留最近 RETENTION 内的发言时间（排行榜最长统计 30 天）；每隔 COMPACT_INTERVAL_SECONDS 重写一次 .bin 文件
+    RETENTION = timedelta(days=31)
+    COMPACT_INTERVAL_SECONDS = 24 * 60 * 60
+
     def __init__(self):
         self.stats_file = "message_stats.json"
+        self.legacy_log_file = "message_stats.jsonl"
+        # 每个用户的发言时间以 uint32 秒级时间戳（小端）追加存放在 stats/<user_id>.bin
+        self.stats_dir = "stats"
+        os.makedirs(self.stats_dir, exist_ok=True)
+
+        # 路径只解析一次：刷盘时相对预先打开的目录 fd 打开文件。
+        # 临时文件和目标文件在同一目录，保证 os.replace 不跨文件系统。
+        stats_dir_path, self._stats_name = os.path.split(os.path.realpath(self.stats_file))
+        self._dir_fd = _open_dir(stats_dir_path)
+        if self._dir_fd is None:
+            self._stats_name = os.path.join(stats_dir_path, self._stats_name)
+        ts_dir_path = os.path.realpath(self.stats_dir)
+        self._ts_dir_fd = _open_dir(ts_dir_path)
+        self._ts_dir = "" if self._ts_dir_fd is not None else ts_dir_path
+
+        self._since_maintain = 0
+        self._last_maintain = time.monotonic()
+        self._last_compact = time.monotonic()
+        self._expired_users: Set[str] = set()
         self.stats = self.load_stats()
 
+    def close(self):
+        """关闭预先打开的目录 fd；关闭后不应再记录消息"""
+        for fd in (self._dir_fd, self._ts_dir_fd):
+            if fd is not None:
+                os.close(fd)
+        self._dir_fd = self._ts_dir_fd = None
+
+    def _ts_path(self, user_id: str) -> str:
+        return os.path.join(self._ts_dir, f"{user_id}.bin")
+
+    def _append_ts(self, user_id: str, data: bytes):
+        """以 O_APPEND 追加到用户的 .bin 文件；写完即关闭，打开的文件数不随用户数增长"""
+        fd = os.open(
+            self._ts_path(user_id),
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT | _O_BINARY,
+            0o644,
+            dir_fd=self._ts_dir_fd,
+        )
+        try:
+            _write_all(fd, data)
+        finally:
+            os.close(fd)
+
     def load_stats(self) -> dict:
         try:
             with open(self.stats_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+                stats = json.load(f)
+        except FileNotFoundError:
+            stats = {"users": {}}
+
+        # 直接把二进制文件读进 C 数组，无需解析任何字符串。
+        # 数组保持升序（新消息总是按时间追加），计数时可以直接 bisect。
+        self._ts_cache: Dict[str, array] = defaultdict(lambda: array("I"))
+        for name in os.listdir(self.stats_dir):
+            if not name.endswith(".bin"):
+                continue
+            with open(os.path.join(self.stats_dir, name), "rb") as f:
+                data = f.read()
+            timestamps = array("I")
+            timestamps.frombytes(data[:len(data) - len(data) % 4])  # 丢弃中途退出留下的残缺记录
+            if sys.byteorder != "little":
+                timestamps.byteswap()
+            self._ts_cache[name[:-4]] = array("I", sorted(timestamps))
+
+        # 旧版本把 ISO 字符串存在 JSON 的 "messages" 和 message_stats.jsonl 中，首次加载时迁移为二进制文件
+        legacy = defaultdict(list, stats.pop("messages", {}))
+        try:
+            with open(self.legacy_log_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # 进程中途退出时可能留下半行
+                    stats["users"].setdefault(entry["u"], {"username": entry["n"], "first_seen": entry["t"]})
+                    legacy[entry["u"]].append(entry["t"])
         except FileNotFoundError:
-            return {"users": {}, "messages": defaultdict(list)}
+            pass
+
+        if legacy:
+            # 过期的旧记录在写盘前就丢弃，不会进入 .bin 文件
+            cutoff = self._retention_cutoff()
+            for user_id, messages in legacy.items():
+                migrated = array("I", (
+                    ts for ts in (int(datetime.fromisoformat(msg_time).timestamp()) for msg_time in messages)
+                    if ts > cutoff
+                ))
+                if migrated:
+                    self._append_ts(user_id, _pack_ts(migrated))
+                    self._ts_cache[user_id] = array("I", sorted(self._ts_cache[user_id] + migrated))
+            self.stats = stats
+            self.save_stats()
+        if os.path.exists(self.legacy_log_file):
+            os.remove(self.legacy_log_file)
+
+        # 启动时就丢弃过期记录，并只重写受影响的文件
+        self._compact(self._prune())
+        return stats
+
+    def _retention_cutoff(self) -> float:
+        return (datetime.now() - self.RETENTION).timestamp()
+
+    def _prune(self) -> Set[str]:
+        """从内存中丢弃保留期之前的发言时间，返回被裁剪的用户；裁剪后为空的用户从缓存中移除"""
+        cutoff = self._retention_cutoff()
+        trimmed = set()
+        for user_id, timestamps in list(self._ts_cache.items()):
+            expired = bisect_right(timestamps, cutoff)
+            if expired:
+                del timestamps[:expired]
+                trimmed.add(user_id)
+                if not timestamps:
+                    del self._ts_cache[user_id]
+        return trimmed
+
+    def _compact(self, user_ids: Set[str]):
+        """按内存中的数据重写指定用户的 .bin 文件；已没有任何记录的用户直接删除文件"""
+        for user_id in user_ids:
+            timestamps = self._ts_cache.get(user_id)
+            if timestamps:
+                _atomic_write(self._ts_path(user_id), _pack_ts(timestamps), self._ts_dir_fd)
+            else:
+                try:
+                    os.unlink(self._ts_path(user_id), dir_fd=self._ts_dir_fd)
+                except FileNotFoundError:
+                    pass
+
+    def _maintain(self):
+        """丢弃过期的发言时间；每隔 COMPACT_INTERVAL_SECONDS 只重写被裁剪过的 .bin 文件"""
+        self._expired_users |= self._prune()
+        if self._expired_users and time.monotonic() - self._last_compact > self.COMPACT_INTERVAL_SECONDS:
+            self._compact(self._expired_users)
+            self._expired_users.clear()
+            self._last_compact = time.monotonic()
+        self._since_maintain = 0
+        self._last_maintain = time.monotonic()
 
     def save_stats(self):
-        with open(self.stats_file, "w", encoding="utf-8") as f:
-            json.dump(self.stats, f, indent=2, ensure_ascii=False)
+        """写入用户信息；发言时间由 record_message 直接追加到各用户的 .bin 文件"""
+        _atomic_write(self._stats_name, orjson.dumps(self.stats, option=orjson.OPT_INDENT_2), self._dir_fd)
 
     def record_message(self, user_id: int, username: str, date: datetime):
         """记录用户的发言数据"""
         user_id_str = str(user_id)
-
-        # ✅ Ensure user exists in 'users' section
-        if user_id_str not in self.stats["users"]:
-            self.stats["users"][user_id_str] = {
-                "username": username,
-                "first_seen": date.isoformat()
-            }
-
-        # ✅ Ensure user exists in 'messages' section
-        if user_id_str not in self.stats["messages"]:
-            self.stats["messages"][user_id_str] = []
-
-        # ✅ Now it's safe to append
-        self.stats["messages"][user_id_str].append(date.isoformat())
-
-        # Save the updated stats
-        self.save_stats()
+        ts = int(date.timestamp())
+
+        # 只在用户的第一条消息时调用 isoformat()
+        users = self.stats["users"]
+        if user_id_str not in users:
+            users[user_id_str] = {"username": username, "first_seen": date.isoformat()}
+            self.save_stats()  # 新用户很少出现，立即落盘，进程崩溃后排行榜仍能找到用户名
+        self._ts_cache[user_id_str].append(ts)
+        # 每条记录立即写入文件（仅 4 字节），进程被杀也不会丢失已处理的消息
+        self._append_ts(user_id_str, _TS_STRUCT.pack(ts))
+
+        self._since_maintain += 1
+        if (
+            self._since_maintain >= self.MAINTAIN_EVERY_MESSAGES
+            or time.monotonic() - self._last_maintain > self.MAINTAIN_INTERVAL_SECONDS
+        ):
+            self._maintain()
+
+    def _period_start(self, period: str) -> float:
+        return (datetime.now() - _PERIODS.get(period, _ALL_TIME)).timestamp()
+
+    def _count_since(self, user_id: str, start_ts: float) -> int:
+        timestamps = self._ts_cache[user_id]
+        return len(timestamps) - bisect_right(timestamps, start_ts)
 
     def get_user_stats(self, user_id: str, period: str) -> int:
-        if user_id not in self.stats["messages"]:
+        if user_id not in self._ts_cache:
             return 0
-
-        messages = self.stats["messages"][user_id]
-        now = datetime.now()
-        start_time = now - {
-            "day": timedelta(days=1),
-            "week": timedelta(weeks=1),
-            "month": timedelta(days=30),
-        }.get(period, timedelta(days=99999))
-
-        return sum(1 for msg_time in messages if datetime.fromisoformat(msg_time) > start_time)
+        return self._count_since(user_id, self._period_start(period))
 
     def get_leaderboard(self, period: str, limit: int = 10) -> List[dict]:
-        return sorted(
-            [
-                {
-                    "user_id": user_id,
-                    "username": self.stats["users"][user_id]["username"],
-                    "count": self.get_user_stats(user_id, period),
-                }
-                for user_id in self.stats["messages"]
-            ],
-            key=lambda x: x["count"],
-            reverse=True,
-        )[:limit]
+        """返回统计周期内发言最多的用户；周期内没有发言的用户不会出现在结果里"""
+        start_ts = self._period_start(period)  # 整个排行榜只取一次当前时间
+        # 排序时只用元组，只为最终的前 limit 名构造 dict
+        scored = (
+            (count, user_id)
+            for user_id in self._ts_cache
+            if (count := self._count_since(user_id, start_ts)) > 0
+        )
+        users = self.stats["users"]
+        return [
+            {"user_id": user_id, "username": users[user_id]["username"], "count": count}
+            for count, user_id in heapq.nlargest(limit, scored, key=itemgetter(0))
+        ]
+
+def _install_queue_logging(logger: logging.Logger):
+    """让 logger 的日志只入队，格式化和输出交给后台线程，不占用事件循环
+
+    logger 是模块级共享的，已经安装过时直接返回，多次创建 KeywordBot 也不会重复输出。
+    """
+    if any(isinstance(handler, QueueHandler) for handler in logger.handlers):
+        return
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False  # 避免再经由 root 的同步 handler 输出一次
+
+# 关键词匹配的两种实现，规则相同：最靠左的匹配，同一位置取最长的关键词；仅大小写不同的关键词以先添加的为准
+
+def _compile_automaton(entries: List[Tuple[str, str]]):
+    """编译成 Aho–Corasick 自动机，键为小写关键词，值为 (键长度, keyword, response)"""
+    automaton = ahocorasick.Automaton()
+    for keyword, response in entries:
+        key = keyword.lower()
+        if not automaton.exists(key):
+            automaton.add_word(key, (len(key), keyword, response))
+    automaton.make_automaton()
+    return automaton
+
+def _automaton_first_match(automaton, text: str) -> Optional[Tuple[str, str]]:
+    # 不能用 iter_long：较长关键词的前缀一直延伸到文本末尾时，它会漏掉其中包含的短关键词。
+    # 这里用 iter 取出全部（可重叠的）匹配，按 (起点, -长度) 取最小者。
+    # 自动机的键是小写的，需要一份小写文本；只有正则分支能在引擎内部忽略大小写而不复制。
+    best = min(
+        (
+            (end - length + 1, -length, keyword, response)
+            for end, (length, keyword, response) in automaton.iter(text.lower())
+        ),
+        default=None,
+    )
+    return None if best is None else best[2:]
+
+def _compile_regex(entries: List[Tuple[str, str]]):
+    """编译成忽略大小写的正则多选分支"""
+    # 正则在最靠左的位置取第一个能匹配的分支，按长度降序排列即为最长匹配。
+    # 每个关键词一个捕获组，用 lastindex 直接定位命中的关键词。
+    entries = sorted(entries, key=lambda entry: len(entry[0]), reverse=True)
+    pattern = re.compile("|".join(f"({re.escape(keyword)})" for keyword, _ in entries), re.IGNORECASE)
+    return pattern, entries
+
+def _regex_first_match(matcher, text: str) -> Optional[Tuple[str, str]]:
+    pattern, entries = matcher
+    match = pattern.search(text)
+    return entries[match.lastindex - 1] if match else None
 
 class KeywordBot:
+    # 连续的关键词修改在这个时间窗口内只写一次 keywords.json
+    SAVE_DEBOUNCE_SECONDS = 0.2
+
     def __init__(self, config_path: str = "config.json"):
         try:
             with open(config_path, "r", encoding="utf-8") as f:
@@ -86,10 +347,13 @@ class KeywordBot:
         except FileNotFoundError:
             print("❌ Error: config.json file not found!")
             self.config = {"bot_token": "", "allowed_group_ids": []}
+        self._allowed_group_ids = frozenset(self.config.get("allowed_group_ids", ()))
 
         self.logger = logging.getLogger(__name__)
         logging.basicConfig(level=logging.INFO)
 
+        _install_queue_logging(self.logger)
+
         self.message_stats = MessageStats()
 
         try:
@@ -97,6 +361,8 @@ class KeywordBot:
                 self.keywords = json.load(f)
         except FileNotFoundError:
             self.keywords = {}
+        self._build_matcher()
+        self._save_timer: Optional[asyncio.TimerHandle] = None
 
         try:
             with open("user_roles.json", "r", encoding="utf-8") as f:
@@ -104,19 +370,70 @@ class KeywordBot:
         except FileNotFoundError:
             self.user_roles = {}
 
+        # user_roles 只在启动时加载、运行期间不会修改，用户等级可以按 user_id 一直缓存
+        self._user_rank = lru_cache(maxsize=4096)(self._user_rank_uncached)
+
     def save_data(self):
-        with open("keywords.json", "w", encoding="utf-8") as f:
-            json.dump(self.keywords, f, indent=2, ensure_ascii=False)
+        """保存关键词；在事件循环中时，SAVE_DEBOUNCE_SECONDS 内的多次保存合并为一次写盘"""
+        self._matcher_dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_keywords()
+            return
+        if self._save_timer is None:
+            self._save_timer = loop.call_later(self.SAVE_DEBOUNCE_SECONDS, self._write_keywords)
+
+    def _write_keywords(self):
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+        _atomic_write("keywords.json", orjson.dumps(self.keywords, option=orjson.OPT_INDENT_2))
+
+    def _build_matcher(self):
+        """把当前关键词编译成匹配器，每个角色等级一个
+
+        每个等级的匹配器只包含该等级有权触发的关键词，所以扫描到的第一个匹配就是要回复的关键词，
+        无权触发的关键词不会遮住同一位置上有权触发的关键词。匹配规则是最靠左、同一位置取最长。
+        """
+        entries = []
+        for keyword, data in self.keywords.items():
+            permission_str = data.get('permission_level', 'PUBLIC')  # Default to PUBLIC
+            try:
+                required_level = PermissionLevel[permission_str]
+            except KeyError:
+                self.logger.error(f"❌ Invalid permission level: {permission_str}")
+                required_level = PermissionLevel.PUBLIC  # Fallback
+            entries.append((keyword, data['response'], _ROLE_HIERARCHY[required_level.name]))
+
+        # 空自动机无法迭代，空正则会匹配任何文本，所以没有可触发关键词的等级不建匹配器
+        self._matchers = {}
+        for rank in set(_ROLE_HIERARCHY.values()):
+            allowed = [(keyword, response) for keyword, response, required in entries if required <= rank]
+            self._matchers[rank] = self._compile_matcher(allowed) if allowed else None
+        self._matcher_dirty = False
+
+    @staticmethod
+    def _compile_matcher(entries: List[Tuple[str, str]]):
+        """优先编译成 Aho–Corasick 自动机；未安装 pyahocorasick 时退回到忽略大小写的正则"""
+        if ahocorasick is not None:
+            return _compile_automaton(entries)
+        return _compile_regex(entries)
+
+    def _match(self, text: str, rank: int) -> Optional[Tuple[str, str]]:
+        """返回文本中该等级有权触发的第一个关键词及其回复；大小写由匹配器自己处理"""
+        matcher = self._matchers[rank]
+        if matcher is None:
+            return None
+        if ahocorasick is not None:
+            return _automaton_first_match(matcher, text)
+        return _regex_first_match(matcher, text)
+
+    def _user_rank_uncached(self, user_id: int) -> int:
+        return _ROLE_HIERARCHY.get(self.user_roles.get(str(user_id), "MEMBER"), 1)
 
     def check_permission(self, user_id: int, required_level):
-        if not hasattr(self, "user_roles"):
-            self.user_roles = {}
-
-        user_role = self.user_roles.get(str(user_id), "MEMBER")
-
-        role_hierarchy = {"MEMBER": 1, "ADMIN": 2, "OWNER": 3}
-
-        return role_hierarchy.get(user_role, 1) >= role_hierarchy.get(required_level.name, 1)
+        return self._user_rank(user_id) >= _ROLE_HIERARCHY.get(required_level.name, 1)
 
     async def add_keyword(self, update: Update, context: CallbackContext):
         user_id = update.message.from_user.id
@@ -140,12 +457,19 @@ class KeywordBot:
         self.save_data()
         await update.message.reply_text(f"关键词 '{keyword}' 已添加，回复内容: {response}")
 
+    async def post_shutdown(self, application: Application):
+        if self._save_timer is not None:
+            self._write_keywords()
+        self.message_stats.close()
+
     async def message_handler(self, update: Update, context: CallbackContext):
-        self.logger.info(f"🔹 Received message: {update.message.text}")
-        self.logger.info(f"🔹 Available keywords: {list(self.keywords.keys())}")
+        # 逐条消息的日志只在 DEBUG 级别输出，并使用 %s 延迟格式化
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("🔹 Received message: %s", update.message.text)
+            self.logger.debug("🔹 Available keywords: %d entries", len(self.keywords))
 
-        if update.message.chat.id not in self.config['allowed_group_ids']:
-            self.logger.info(f"❌ Chat ID {update.message.chat.id} not allowed.")
+        if update.message.chat.id not in self._allowed_group_ids:
+            self.logger.debug("❌ Chat ID %s not allowed.", update.message.chat.id)
             return
 
         user = update.message.from_user
@@ -155,35 +479,37 @@ class KeywordBot:
             update.message.date
         )
 
-        text = update.message.text.strip().lower()
-        self.logger.info(f"🔹 Checking message text: {text}")
+        # 没有任何关键词时只做统计，跳过文本处理
+        if not self.keywords:
+            return
 
-        for keyword, data in self.keywords.items():
-            self.logger.info(f"🔹 Checking keyword: {keyword}")
+        text = update.message.text
+        self.logger.debug("🔹 Checking message text: %s", text)
 
-            if keyword.lower() in text:
-                self.logger.info(f"✅ Keyword '{keyword}' matched!")
+        # 关键词只在增删改之后才重建自动机
+        if self._matcher_dirty:
+            self._build_matcher()
 
-                permission_str = data.get('permission_level', 'PUBLIC')  # Default to PUBLIC
-                try:
-                    required_level = PermissionLevel[permission_str]
-                except KeyError:
-                    self.logger.error(f"❌ Invalid permission level: {permission_str}")
-                    required_level = PermissionLevel.PUBLIC  # Fallback
+        # 匹配器按用户等级选取，命中的关键词一定是该用户有权触发的
+        matched = self._match(text, self._user_rank(user.id))
+        if matched is None:
+            return
 
-                if self.check_permission(user.id, required_level):
-                    self.logger.info(f"✅ User {user.id} has permission. Sending response...")
-                    await update.message.reply_text(data['response'])
-                    return
-                else:
-                    self.logger.info(f"❌ User {user.id} does NOT have permission.")
+        keyword, response = matched
+        self.logger.debug("✅ Keyword '%s' matched for user %s. Sending response...", keyword, user.id)
+        await update.message.reply_text(response)
 
 
 
 
 def main():
     bot = KeywordBot()
-    application = Application.builder().token(bot.config["bot_token"]).build()
+    application = (
+        Application.builder()
+        .token(bot.config["bot_token"])
+        .post_shutdown(bot.post_shutdown)
+        .build()
+    )
 
     application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, bot.message_handler))
     application.add_handler(CommandHandler("add_keyword", bot.add_keyword))
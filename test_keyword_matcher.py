@@ -0,0 +1,61 @@
+"""关键词匹配两种实现（Aho–Corasick / 正则）的差分测试"""
+import importlib.util
+import os
+import random
+
+import pytest
+
+pytest.importorskip("telegram")
+pytest.importorskip("ahocorasick")
+
+_spec = importlib.util.spec_from_file_location(
+    "keyword_bot", os.path.join(os.path.dirname(__file__), "advanced-keyword-bot.py")
+)
+bot = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bot)
+
+
+def reference_first_match(entries, text):
+    """逐个关键词查找：最靠左的匹配，同一位置取最长；仅大小写不同的关键词以先添加的为准"""
+    keys = {}
+    for keyword, response in entries:
+        keys.setdefault(keyword.lower(), (keyword, response))
+    lowered = text.lower()
+    best = None
+    for key, entry in keys.items():
+        start = lowered.find(key)
+        if start != -1 and (best is None or (start, -len(key)) < best[0]):
+            best = ((start, -len(key)), entry)
+    return None if best is None else best[1]
+
+
+def both_backends(entries, text):
+    return (
+        bot._automaton_first_match(bot._compile_automaton(entries), text),
+        bot._regex_first_match(bot._compile_regex(entries), text),
+    )
+
+
+@pytest.mark.parametrize(
+    "keywords, text, expected",
+    [
+        (["新年快乐", "年"], "过新年", "年"),
+        (["价格表", "格"], "什么价格", "格"),
+        (["new year party", "year"], "happy new year", "year"),
+        (["ab", "abc"], "xxABC", "abc"),
+        (["Hi", "hi"], "HI", "Hi"),
+    ],
+)
+def test_known_cases(keywords, text, expected):
+    entries = [(keyword, keyword) for keyword in keywords]
+    assert both_backends(entries, text) == ((expected, expected), (expected, expected))
+
+
+def test_backends_agree_with_reference():
+    rng = random.Random(0)
+    for _ in range(5000):
+        keywords = ["".join(rng.choices("abcAB年", k=rng.randint(1, 4))) for _ in range(rng.randint(1, 6))]
+        entries = [(keyword, str(i)) for i, keyword in enumerate(keywords)]
+        text = "".join(rng.choices("abcAB年 ", k=rng.randint(0, 12)))
+        expected = reference_first_match(entries, text)
+        assert both_backends(entries, text) == (expected, expected), (entries, text)